@@ -5,7 +5,8 @@ This app allows users to upload audio files, apply audio effects,
 and visualize or download the processed audio.
 """
 
-import tempfile
+import hashlib
+
 import streamlit as st
 from audio_processor import AudioProcessor
 from utils.visualization import (
@@ -13,8 +14,8 @@ from utils.visualization import (
     plot_spectrogram,
     plot_frequency_spectrum,
     plot_comprehensive_comparison,
+    compute_spectra,
 )
-from utils.file_utils import save_uploaded_file, cleanup_temp_files
 import config
 
 st.set_page_config(page_title='Audio Vocoder', layout='wide')
@@ -50,26 +51,26 @@ def process_and_display_audio(audio_processor, context, params):
     Args:
         audio_processor (AudioProcessor): The audio processor instance.
         context (dict): Dictionary containing:
-            - input_path (str): Path to input audio file.
             - uploaded_file: Uploaded file object.
             - selected_effect (str): Name of the effect.
             - original_audio (np.ndarray): Original audio data.
             - sample_rate (int): Original sample rate.
+            - original_spectra (AudioSpectra or None): Precomputed spectra
+              of the original audio, computed here when None.
         params (dict): Effect parameters.
 
     Returns:
-        str: output_path
+        bytes: The processed audio encoded as WAV.
     """
     st.subheader('Result')
 
-    processed_audio, processed_sr = audio_processor.process_audio(
-        context['input_path'], context['selected_effect'], params
+    # Reuse the samples decoded once per upload instead of decoding again
+    processed_audio, processed_sr = audio_processor.apply_effect(
+        context['original_audio'], context['sample_rate'],
+        context['selected_effect'], params
     )
 
-    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-        output_path = tmp_file.name
-
-    audio_processor.save_audio(processed_audio, processed_sr, output_path)
+    wav_bytes = audio_processor.save_audio_bytes(processed_audio, processed_sr)
 
     # Display comprehensive comparison
     effect_name = context['selected_effect'].title()
@@ -77,22 +78,22 @@ def process_and_display_audio(audio_processor, context, params):
         context['original_audio'],
         processed_audio,
         context['sample_rate'],
-        f"{effect_name} Effect"
+        f"{effect_name} Effect",
+        original_spectra=context['original_spectra'],
     )
 
     # Audio player
-    st.audio(output_path)
+    st.audio(wav_bytes, format='audio/wav')
 
     # Download button
-    with open(output_path, 'rb') as f:
-        st.download_button(
-            label='Download Result',
-            data=f,
-            file_name=f"processed_{context['uploaded_file'].name}",
-            mime='audio/wav',
-        )
+    st.download_button(
+        label='Download Result',
+        data=wav_bytes,
+        file_name=f"processed_{context['uploaded_file'].name}",
+        mime='audio/wav',
+    )
 
-    return output_path
+    return wav_bytes
 
 def display_original_audio_analysis(original_audio, sample_rate):
     """
@@ -104,6 +105,14 @@ def display_original_audio_analysis(original_audio, sample_rate):
     """
     st.subheader('Original Signal Analysis')
 
+    # One STFT shared by the frequency and spectrogram tabs, and kept
+    # for the before/after comparison once an effect is applied.
+    # main() drops it whenever a different file is uploaded.
+    spectra = st.session_state.get('orig_spectra')
+    if spectra is None:
+        spectra = compute_spectra(original_audio, sample_rate)
+        st.session_state['orig_spectra'] = spectra
+
     # Create tabs for different visualizations
     tab1, tab2, tab3 = st.tabs(["Waveform", "Frequency Analysis", "Spectrogram"])
 
@@ -111,10 +120,12 @@ def display_original_audio_analysis(original_audio, sample_rate):
         plot_audio_waveform(original_audio, sample_rate, 'Original Waveform')
 
     with tab2:
-        plot_frequency_spectrum(original_audio, sample_rate, 'Original Frequency Spectrum')
+        plot_frequency_spectrum(original_audio, sample_rate, 'Original Frequency Spectrum',
+                                spectra=spectra)
 
     with tab3:
-        plot_spectrogram(original_audio, sample_rate, 'Original Spectrogram')
+        plot_spectrogram(original_audio, sample_rate, 'Original Spectrogram',
+                         spectra=spectra)
 
 def main():
     """
@@ -134,16 +145,28 @@ def main():
             st.error('File too large')
             return
 
-        input_path = save_uploaded_file(uploaded_file)
+        # Decode straight from the upload buffer instead of a temp file
+        input_data = uploaded_file.getvalue()
+        file_hash = hashlib.blake2b(input_data, digest_size=16).hexdigest()
 
         try:
-            original_audio, sample_rate = audio_processor.load_audio(input_path)
+            # Every widget interaction reruns the script; decode and
+            # analyse each upload only once per session
+            if st.session_state.get('audio_hash') != file_hash:
+                audio, sr = audio_processor.load_audio(input_data)
+                st.session_state.pop('orig_spectra', None)
+                st.session_state['audio'] = audio
+                st.session_state['sr'] = sr
+                st.session_state['audio_hash'] = file_hash
+
+            original_audio = st.session_state['audio']
+            sample_rate = st.session_state['sr']
 
             # Display original audio analysis
             display_original_audio_analysis(original_audio, sample_rate)
 
             # Audio player for original
-            st.audio(input_path)
+            st.audio(input_data, format=uploaded_file.type)
 
             # Effect selection
             selected_effect, params = select_effect_and_params(audio_processor)
@@ -152,25 +175,23 @@ def main():
                 with st.spinner('Processing...'):
                     try:
                         context = {
-                            'input_path': input_path,
                             'uploaded_file': uploaded_file,
                             'selected_effect': selected_effect,
                             'original_audio': original_audio,
                             'sample_rate': sample_rate,
+                            'original_spectra': st.session_state.get(
+                                'orig_spectra'
+                            ),
                         }
 
                         # Process audio and get results
-                        output_path = process_and_display_audio(
+                        process_and_display_audio(
                             audio_processor, context, params
                         )
-
-                        cleanup_temp_files([output_path])
                     except (IOError, ValueError) as ex:
                         st.error(f'Processing error: {str(ex)}')
         except (IOError, ValueError) as ex:
             st.error(f'Error: {str(ex)}')
-        finally:
-            cleanup_temp_files([input_path])
 
 if __name__ == '__main__':
     main()
@@ -5,14 +5,35 @@ This module handles loading, saving, and processing audio files
 with various effects.
 """
 
+import io
+import os
+import tempfile
+
 import librosa
+import scipy.fft
 import soundfile as sf
 
+try:
+    import pyfftw
+    import pyfftw.interfaces.scipy_fft
+except ImportError:
+    pyfftw = None
+
 from effects.robot_effect import RobotEffect
 from effects.pitch_effect import PitchEffect
 from effects.speed_effect import SpeedEffect
 from effects.echo_effect import EchoEffect
 
+# Optional FFTW backend for every scipy.fft call in the app: the
+# spectrogram analysis and, from Librosa 0.11 (which defaults to
+# scipy.fft), the STFTs in the effects; Librosa 0.10 keeps them on
+# numpy.fft. Plans are cached between calls, which pays off when
+# same-length audio is re-analysed.
+if pyfftw is not None:
+    pyfftw.interfaces.cache.enable()
+    pyfftw.interfaces.cache.set_keepalive_time(30)
+    scipy.fft.set_global_backend(pyfftw.interfaces.scipy_fft)
+
 
 class AudioProcessor:
     """
@@ -55,8 +76,15 @@ class AudioProcessor:
         """
         Loads an audio file.
 
+        In-memory sources are decoded by soundfile directly. If the
+        installed libsndfile cannot read the format (e.g. MP3 before
+        libsndfile 1.1), they are written to a temporary file so Librosa
+        can fall back to audioread, which only handles paths.
+
         Args:
-            file_path (str): Path to the audio file to load.
+            file_path (str, file-like or bytes): Path to the audio file to
+                load, an open binary file object, or the encoded file
+                contents (e.g. an upload held in memory).
 
         Returns:
             tuple: (audio_data (np.ndarray), sample_rate (int))
@@ -64,12 +92,41 @@ class AudioProcessor:
         Raises:
             IOError: If loading fails.
         """
+        if isinstance(file_path, (bytes, bytearray, memoryview)):
+            file_path = io.BytesIO(file_path)
+
         try:
-            audio_data, sample_rate = librosa.load(file_path, sr=None)
+            try:
+                audio_data, sample_rate = librosa.load(file_path, sr=None)
+            except sf.SoundFileError:
+                if not hasattr(file_path, 'read'):
+                    raise
+                file_path.seek(0)
+                audio_data, sample_rate = self._load_via_temp_file(
+                    file_path.read()
+                )
             return audio_data, sample_rate
         except Exception as e:
             raise IOError(f'Error loading audio: {str(e)}') from e
 
+    @staticmethod
+    def _load_via_temp_file(data):
+        """
+        Decodes encoded audio bytes through a temporary file.
+
+        Args:
+            data (bytes): Encoded audio file contents.
+
+        Returns:
+            tuple: (audio_data (np.ndarray), sample_rate (int))
+        """
+        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
+            tmp_file.write(data)
+        try:
+            return librosa.load(tmp_file.name, sr=None)
+        finally:
+            os.unlink(tmp_file.name)
+
     def save_audio(self, audio_data, sample_rate, output_path):
         """
         Saves an audio file.
@@ -91,12 +148,35 @@ class AudioProcessor:
         except Exception as e:
             raise IOError(f'Error saving audio: {str(e)}') from e
 
+    def save_audio_bytes(self, audio_data, sample_rate):
+        """
+        Encodes audio as an in-memory 16-bit PCM WAV file.
+
+        Args:
+            audio_data (np.ndarray): Audio data to encode.
+            sample_rate (int): Sampling rate.
+
+        Returns:
+            bytes: Contents of the WAV file.
+
+        Raises:
+            IOError: If encoding fails.
+        """
+        try:
+            buffer = io.BytesIO()
+            sf.write(buffer, audio_data, sample_rate, format='WAV',
+                     subtype='PCM_16')
+            return buffer.getvalue()
+        except Exception as e:
+            raise IOError(f'Error saving audio: {str(e)}') from e
+
     def process_audio(self, input_path, effect_name, parameters):
         """
         Applies an audio effect on a file.
 
         Args:
-            input_path (str): Path to the audio file to process.
+            input_path (str, file-like or bytes): Audio file to process;
+                anything accepted by ``load_audio``.
             effect_name (str): Name of the effect to apply.
             parameters (dict): Parameters of the effect.
 
@@ -110,6 +190,28 @@ class AudioProcessor:
             raise ValueError(f'Effect {effect_name} not available')
 
         audio_data, sample_rate = self.load_audio(input_path)
+        return self.apply_effect(audio_data, sample_rate, effect_name,
+                                 parameters)
+
+    def apply_effect(self, audio_data, sample_rate, effect_name, parameters):
+        """
+        Applies an audio effect on already decoded samples.
+
+        Args:
+            audio_data (np.ndarray): Audio samples; they are not modified.
+            sample_rate (int): Sample rate of the audio.
+            effect_name (str): Name of the effect to apply.
+            parameters (dict): Parameters of the effect.
+
+        Returns:
+            tuple: (processed_audio (np.ndarray), sample_rate (int))
+
+        Raises:
+            ValueError: If the requested effect does not exist.
+        """
+        if effect_name not in self.effects:
+            raise ValueError(f'Effect {effect_name} not available')
+
         effect = self.effects[effect_name]
         processed_audio = effect.apply(audio_data, sample_rate, **parameters)
         return processed_audio, sample_rate
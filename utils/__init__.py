@@ -10,6 +10,8 @@ Provides helper functions used across the application.
 
 from .file_utils import save_uploaded_file, cleanup_temp_files
 from .visualization import (
+    AudioSpectra,
+    compute_spectra,
     plot_audio_waveform,
     plot_spectrogram,
     plot_comparison
@@ -3,13 +3,438 @@ Visualization utilities for audio data.
 
 Functions to plot audio waveforms, spectrograms, frequency spectra,
 and comparisons using matplotlib and Streamlit.
+
+Matplotlib, ``scipy.signal`` and the optional CuPy are imported on first
+use rather than at import time, so the app starts without waiting for
+font-cache and plugin discovery or CUDA initialisation.
 """
 
+import io
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+
 import streamlit as st
-import matplotlib.pyplot as plt
 import numpy as np
-import librosa
-import librosa.display
+import scipy.fft
+
+N_FFT = 2048
+HOP_LENGTH = N_FFT // 4
+TOP_DB = 80.0
+WAVEFORM_MAX_POINTS = 2000
+FIGURE_DPI = 80
+# Spectrogram figures are 10 inches wide at FIGURE_DPI, so their axes are
+# narrower than this many pixels; more columns only cost memory in the
+# cache and colormap work when plotting
+SPECTROGRAM_MAX_COLUMNS = 10 * FIGURE_DPI
+
+# Streamlit executes each script run on its own thread, so pooled figures
+# are reused within a run and kept per thread so concurrent runs never
+# draw on the same canvas. They are not registered with pyplot, so a
+# finished run's pool is garbage collected with its thread.
+_FIG_POOL = threading.local()
+
+
+@dataclass
+class AudioSpectra:
+    """
+    Spectral analysis of one signal, shared by the spectrum and
+    spectrogram plots so each signal is transformed only once.
+
+    Attributes:
+        stft_db (np.ndarray): dB spectrogram of shape (n_bins, n_columns),
+            max-pooled along time to at most ``SPECTROGRAM_MAX_COLUMNS``.
+        psd (np.ndarray): One-sided Welch power spectral density per
+            frequency bin, averaged over the STFT frames.
+        sr (int): Sampling rate of the audio.
+        duration (float): Signal length in seconds.
+        hop (int): Samples between consecutive spectrogram columns.
+    """
+
+    stft_db: np.ndarray
+    psd: np.ndarray
+    sr: int
+    duration: float
+    hop: int
+
+    @property
+    def freqs(self):
+        """np.ndarray: Center frequency of each bin in Hz."""
+        return scipy.fft.rfftfreq(2 * (self.stft_db.shape[0] - 1), 1/self.sr)
+
+    @property
+    def times(self):
+        """np.ndarray: Start time of each column in seconds."""
+        return np.arange(self.stft_db.shape[1]) * self.hop / self.sr
+
+
+@lru_cache(maxsize=None)
+def _get_matplotlib():
+    """
+    Import matplotlib (figure and colors) on first use.
+
+    ``matplotlib.pyplot`` is deliberately avoided: figures created through
+    it stay registered in its global figure manager until closed.
+    """
+    import matplotlib
+    import matplotlib.colors
+    import matplotlib.figure
+    return matplotlib
+
+
+@lru_cache(maxsize=None)
+def _has_gpu():
+    """
+    Whether CuPy is installed and can see a CUDA device, probed once.
+    """
+    try:
+        import cupy as cp
+        return cp.cuda.runtime.getDeviceCount() > 0
+    except (ImportError, RuntimeError):
+        return False
+
+
+@lru_cache(maxsize=4)
+def _colormap_lut(name):
+    """
+    Return a cached 256-entry uint8 RGB lookup table for a colormap.
+    """
+    lut = _get_matplotlib().colormaps[name](np.arange(256))[:, :3]
+    return (lut * 255).astype(np.uint8)
+
+
+@lru_cache(maxsize=8)
+def _stft_setup(n_fft):
+    """
+    Return the cached per-size STFT setup for frames of ``n_fft`` samples.
+
+    Returns:
+        tuple: (float32 periodic Hann window, rfft length)
+    """
+    import scipy.signal
+    window = scipy.signal.windows.hann(n_fft, sym=False).astype(np.float32)
+    return window, scipy.fft.next_fast_len(n_fft, real=True)
+
+
+def _get_figure(figsize, shape=(1, 1)):
+    """
+    Return a pooled figure and its first axes, cleared for redrawing.
+
+    Building a matplotlib figure (canvas, tick locators, fonts) costs far
+    more than clearing one, and Streamlit reruns the plots on every widget
+    interaction. ``_show_figure`` encodes the figure immediately, so one
+    figure per size can be reused for consecutive plots within a run.
+
+    Args:
+        figsize (tuple): Figure size in inches.
+        shape (tuple): Subplot grid as (nrows, ncols).
+
+    Returns:
+        tuple: (matplotlib.figure.Figure, matplotlib.axes.Axes)
+    """
+    pool = getattr(_FIG_POOL, 'figures', None)
+    if pool is None:
+        pool = _FIG_POOL.figures = {}
+
+    key = (figsize, shape)
+    fig = pool.get(key)
+    if fig is None:
+        fig = _get_matplotlib().figure.Figure(figsize=figsize, dpi=FIGURE_DPI)
+        fig.subplots(*shape)
+        pool[key] = fig
+    else:
+        # Colorbars live in their own axes; drop them before clearing
+        for ax in list(fig.axes):
+            for artist in ax.images + ax.collections:
+                if getattr(artist, 'colorbar', None) is not None:
+                    artist.colorbar.remove()
+        for ax in fig.axes:
+            ax.clear()
+
+    return fig, fig.axes[0]
+
+
+def _show_figure(fig):
+    """
+    Send a figure to the page as a PNG encoded at ``FIGURE_DPI``.
+
+    ``st.pyplot`` ignores the figure's dpi and always saves at its own
+    (200 dpi in current Streamlit), so the PNG is encoded here instead.
+
+    Args:
+        fig (matplotlib.figure.Figure): Figure to display.
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=FIGURE_DPI, bbox_inches='tight')
+    st.image(buffer)
+
+
+def _pad_batch(signals, n_fft):
+    """
+    Stack signals into one zero-padded float32 array for framing.
+
+    Each row is centered with ``n_fft // 2`` zeros like ``librosa.stft``
+    and padded at the end to the longest signal.
+
+    Args:
+        signals (list[np.ndarray]): Audio signals.
+        n_fft (int): Frame length in samples.
+
+    Returns:
+        np.ndarray: Array of shape (n_signals, max_len + 2 * (n_fft // 2)).
+    """
+    max_len = max(len(signal) for signal in signals)
+    batch = np.zeros((len(signals), max_len + 2 * (n_fft // 2)),
+                     dtype=np.float32)
+    for i, signal in enumerate(signals):
+        batch[i, n_fft // 2:n_fft // 2 + len(signal)] = signal
+    return batch
+
+
+def _batched_stft(signals, n_fft=N_FFT, hop_length=HOP_LENGTH):
+    """
+    Compute complex STFTs of several real signals with one batched FFT.
+
+    Signals are zero-padded to a common length and framed into a single
+    (batch, n_fft, n_frames) array, so one ``scipy.fft.rfft`` call covers
+    all of them (served by pyFFTW when ``audio_processor`` installs it as
+    the global backend). Each result is trimmed back to its own frame
+    count.
+    Frames are centered the same way as ``librosa.stft``.
+
+    Args:
+        signals (list[np.ndarray]): Audio signals.
+        n_fft (int): Frame length in samples.
+        hop_length (int): Number of samples between frames.
+
+    Returns:
+        list[np.ndarray]: Complex64 STFT of shape (n_bins, n_frames)
+        for each signal.
+    """
+    batch = _pad_batch(signals, n_fft)
+    # Strided view of shape (batch, n_fft, n_frames); nothing is copied
+    # until the window is applied
+    frames = np.lib.stride_tricks.sliding_window_view(
+        batch, n_fft, axis=-1
+    )[:, ::hop_length].transpose(0, 2, 1)
+    # scipy.signal.ShortTimeFFT would also cache this setup, but it
+    # returns complex128 and measured slower than one batched rfft
+    window, fft_length = _stft_setup(n_fft)
+
+    windowed = np.multiply(frames, window[:, np.newaxis], dtype=np.float32)
+    # The windowed frames are scratch space, so the FFT may reuse them
+    stft = scipy.fft.rfft(windowed, n=fft_length, axis=1, workers=-1,
+                          overwrite_x=True)
+
+    return [stft[i, :, :1 + len(signal) // hop_length]
+            for i, signal in enumerate(signals)]
+
+
+def _batched_stft_magnitude_gpu(signals, n_fft=N_FFT, hop_length=HOP_LENGTH):
+    """
+    GPU counterpart of ``_batched_stft`` that returns magnitudes.
+
+    Framing, windowing, the batched rfft and ``abs`` all run on the GPU;
+    only the float32 magnitudes are copied back, half the bytes of the
+    complex STFT. CuPy keeps the cuFFT plan cached after the first call.
+
+    Args:
+        signals (list[np.ndarray]): Audio signals.
+        n_fft (int): Frame length in samples.
+        hop_length (int): Number of samples between frames.
+
+    Returns:
+        list[np.ndarray]: Float32 STFT magnitude of shape
+        (n_bins, n_frames) for each signal.
+    """
+    import cupy as cp
+
+    batch = cp.asarray(_pad_batch(signals, n_fft))
+    n_frames = 1 + (batch.shape[1] - n_fft) // hop_length
+    frames = cp.lib.stride_tricks.as_strided(
+        batch,
+        shape=(batch.shape[0], n_fft, n_frames),
+        strides=(batch.strides[0], batch.strides[1],
+                 batch.strides[1] * hop_length),
+    )
+    window, fft_length = _stft_setup(n_fft)
+
+    stft = cp.fft.rfft(frames * cp.asarray(window)[:, None], n=fft_length,
+                       axis=1)
+    magnitude = cp.asnumpy(cp.abs(stft).astype(cp.float32))
+
+    return [magnitude[i, :, :1 + len(signal) // hop_length]
+            for i, signal in enumerate(signals)]
+
+
+def _batched_stft_magnitude(signals, n_fft=N_FFT, hop_length=HOP_LENGTH):
+    """
+    Compute float32 STFT magnitudes of several signals, on the GPU when
+    CuPy and a CUDA device are available.
+
+    If the GPU path fails (e.g. out of device memory on a long file, or a
+    cuFFT error), the CPU path is used instead, so the optional backend
+    never makes an analysis fail.
+
+    Args:
+        signals (list[np.ndarray]): Audio signals.
+        n_fft (int): Frame length in samples.
+        hop_length (int): Number of samples between frames.
+
+    Returns:
+        list[np.ndarray]: Float32 STFT magnitude of shape
+        (n_bins, n_frames) for each signal.
+    """
+    if _has_gpu():
+        # CuPy's OutOfMemoryError is a MemoryError and its CUDA runtime,
+        # driver and cuFFT errors are RuntimeErrors; a CUDA library it
+        # cannot load on first use raises ImportError
+        try:
+            return _batched_stft_magnitude_gpu(signals, n_fft, hop_length)
+        except (ImportError, MemoryError, RuntimeError):
+            pass
+
+    magnitudes = []
+    for stft in _batched_stft(signals, n_fft, hop_length):
+        magnitude = np.empty(stft.shape, dtype=np.float32)
+        np.abs(stft, out=magnitude)
+        magnitudes.append(magnitude)
+    return magnitudes
+
+
+def _magnitude_to_db(magnitude):
+    """
+    Convert a magnitude spectrogram to dB relative to its maximum, in place.
+
+    The spectrogram is the largest array in the pipeline, so every step
+    writes back into ``magnitude`` instead of allocating a new array.
+
+    Args:
+        magnitude (np.ndarray): Float magnitude spectrogram; overwritten.
+
+    Returns:
+        np.ndarray: ``magnitude`` holding the spectrogram in dB, floored
+        at ``-TOP_DB`` like ``librosa.amplitude_to_db``.
+    """
+    # Clamping at the -TOP_DB level before the log makes the floor free:
+    # the max is read once on the magnitudes and no pass follows the shift
+    ref = max(float(magnitude.max()), 1e-10)
+    np.maximum(magnitude, ref * 10.0 ** (-TOP_DB / 20.0), out=magnitude)
+    np.log10(magnitude, out=magnitude)
+    magnitude *= 20.0
+    magnitude -= 20.0 * np.log10(ref)
+    return magnitude
+
+
+def _welch_psd(magnitude, n_samples, sample_rate, n_fft=N_FFT,
+               hop_length=HOP_LENGTH):
+    """
+    Welch power spectral density from an existing STFT magnitude.
+
+    Only the frames lying wholly inside the signal are averaged; those
+    are Welch's overlapping Hann segments, while the centered edge
+    frames see the zero padding. The result matches
+    ``scipy.signal.welch`` (density scaling, no detrending, same segment
+    length and overlap) without transforming the signal a second time.
+    Signals shorter than ``n_fft`` have no such frame and average all
+    frames instead.
+
+    Args:
+        magnitude (np.ndarray): STFT magnitude of shape (n_bins, n_frames).
+        n_samples (int): Length of the signal the STFT was computed from.
+        sample_rate (int): Sampling rate of the audio.
+        n_fft (int): Frame length the STFT was computed with.
+        hop_length (int): Hop length the STFT was computed with.
+
+    Returns:
+        np.ndarray: One-sided PSD per frequency bin.
+    """
+    window, fft_length = _stft_setup(n_fft)
+    if n_samples >= n_fft:
+        # Frame t starts t * hop_length - n_fft // 2 samples into the signal
+        first = -(-(n_fft // 2) // hop_length)
+        count = 1 + (n_samples - n_fft) // hop_length
+        magnitude = magnitude[:, first:first + count]
+    power = np.einsum('ij,ij->i', magnitude, magnitude) / magnitude.shape[1]
+    psd = power / (sample_rate * np.dot(window, window))
+    # Fold in the negative frequencies, except DC and (even length) Nyquist
+    psd[1:None if fft_length % 2 else -1] *= 2
+    return psd
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _compute_spectra(audio_bytes, sample_rate):
+    """
+    Compute all spectral data needed by the plots for a set of signals.
+
+    Cached by Streamlit on the raw audio bytes, so reruns triggered by
+    widget interaction reuse the previous result. The cache is shared by
+    all sessions, so it is bounded and holds only the downsampled
+    spectrogram the plots actually draw.
+
+    Args:
+        audio_bytes (tuple[bytes]): Float32 audio samples as raw bytes,
+            one entry per signal.
+        sample_rate (int): Sampling rate of the audio.
+
+    Returns:
+        list[AudioSpectra]: One entry per signal.
+    """
+    signals = [np.frombuffer(data, dtype=np.float32) for data in audio_bytes]
+
+    spectra = []
+    for signal, magnitude in zip(signals, _batched_stft_magnitude(signals)):
+        psd = _welch_psd(magnitude, len(signal), sample_rate)
+
+        # Keep the loudest frame of each group per bin, like the waveform's
+        # min/max envelope, so short events between columns stay visible
+        n_frames = magnitude.shape[1]
+        step = -(-n_frames // SPECTROGRAM_MAX_COLUMNS)
+        columns = np.maximum.reduceat(
+            magnitude, np.arange(0, n_frames, step), axis=1
+        )
+
+        spectra.append(AudioSpectra(
+            stft_db=_magnitude_to_db(columns),
+            psd=psd,
+            sr=sample_rate,
+            duration=len(signal) / sample_rate,
+            hop=HOP_LENGTH * step,
+        ))
+    return spectra
+
+
+def compute_spectra(audio_data, sample_rate):
+    """
+    Compute (or fetch from cache) the spectral data for an audio signal.
+
+    Args:
+        audio_data (np.ndarray): Audio signal data.
+        sample_rate (int): Sampling rate of the audio.
+
+    Returns:
+        AudioSpectra: Spectral analysis of ``audio_data``.
+    """
+    return compute_spectra_batch([audio_data], sample_rate)[0]
+
+
+def compute_spectra_batch(signals, sample_rate):
+    """
+    Compute (or fetch from cache) the spectral data for several signals
+    sharing one sample rate, using a single batched FFT.
+
+    Args:
+        signals (list[np.ndarray]): Audio signals.
+        sample_rate (int): Sampling rate of the audio.
+
+    Returns:
+        list[AudioSpectra]: One entry per signal.
+    """
+    audio_bytes = tuple(
+        np.ascontiguousarray(signal, dtype=np.float32).tobytes()
+        for signal in signals
+    )
+    return _compute_spectra(audio_bytes, sample_rate)
 
 
 def plot_audio_waveform(audio_data, sample_rate, title='Audio Waveform'):
@@ -21,22 +446,36 @@ def plot_audio_waveform(audio_data, sample_rate, title='Audio Waveform'):
         sample_rate (int): Sampling rate of the audio.
         title (str): Title of the plot.
     """
-    fig, ax = plt.subplots(figsize=(10, 3))
-
-    times = np.arange(len(audio_data)) / sample_rate
-
-    ax.plot(times, audio_data, linewidth=0.5)
+    fig, ax = _get_figure((10, 3))
+
+    n_samples = len(audio_data)
+    if n_samples > WAVEFORM_MAX_POINTS:
+        # Min/max decimation: one vertical stroke per chunk keeps the
+        # envelope while drawing a few thousand vertices instead of millions.
+        # Chunk edges span the whole signal, so no tail samples are dropped.
+        starts = np.linspace(0, n_samples, WAVEFORM_MAX_POINTS + 1)
+        starts = starts.astype(np.intp)[:-1]
+        times = np.repeat(starts / sample_rate, 2)
+        values = np.empty(2 * WAVEFORM_MAX_POINTS, dtype=audio_data.dtype)
+        values[0::2] = np.minimum.reduceat(audio_data, starts)
+        values[1::2] = np.maximum.reduceat(audio_data, starts)
+    else:
+        times = np.linspace(0.0, (n_samples - 1) / sample_rate, n_samples,
+                            dtype=np.float32)
+        values = audio_data
+
+    ax.plot(times, values, linewidth=0.5)
 
     ax.set_xlabel('Time (s)')
     ax.set_ylabel('Amplitude')
     ax.set_title(title)
     ax.grid(True, alpha=0.3)
 
-    st.pyplot(fig)
-    plt.close()
+    _show_figure(fig)
 
 
-def plot_spectrogram(audio_data, sample_rate, title='Spectrogram'):
+def plot_spectrogram(audio_data, sample_rate, title='Spectrogram',
+                     spectra=None):
     """
     Plot the spectrogram of an audio signal.
 
@@ -44,59 +483,73 @@ def plot_spectrogram(audio_data, sample_rate, title='Spectrogram'):
         audio_data (np.ndarray): Audio signal data.
         sample_rate (int): Sampling rate of the audio.
         title (str): Title of the plot.
+        spectra (AudioSpectra, optional): Precomputed analysis of
+            ``audio_data``.
     """
-    fig, ax = plt.subplots(figsize=(10, 4))
-
-    spectrogram_db = librosa.amplitude_to_db(
-        np.abs(librosa.stft(audio_data)), ref=np.max
-    )
-
-    img = librosa.display.specshow(
-        spectrogram_db,
-        x_axis='time',
-        y_axis='hz',
-        sr=sample_rate,
-        ax=ax,
+    if spectra is None:
+        spectra = compute_spectra(audio_data, sample_rate)
+
+    fig, ax = _get_figure((10, 4))
+
+    spectrogram_db = spectra.stft_db
+
+    # Colormap once through a uint8 lookup table, so Agg blits RGB bytes
+    # instead of normalising and interpolating every float pixel
+    db_min = float(spectrogram_db.min())
+    db_max = float(spectrogram_db.max())
+    levels = (spectrogram_db - db_min) * (255.0 / max(db_max - db_min, 1e-9))
+    rgb = _colormap_lut('magma')[levels.astype(np.uint8)]
+
+    # A single image blit; specshow builds a QuadMesh and custom locators
+    img = ax.imshow(
+        rgb,
+        origin='lower',
+        aspect='auto',
+        extent=[0, spectra.duration, 0, spectra.sr / 2],
+        interpolation='nearest',
     )
+    img.set_rasterized(True)
+    # RGB images ignore cmap/norm when drawing; they only feed the colorbar
+    img.set_cmap('magma')
+    img.set_norm(_get_matplotlib().colors.Normalize(db_min, db_max))
 
+    ax.set_xlabel('Time (s)')
+    ax.set_ylabel('Hz')
     ax.set_title(title)
 
     fig.colorbar(img, ax=ax, format='%+2.0f dB')
 
-    st.pyplot(fig)
-    plt.close()
+    _show_figure(fig)
 
 
-def plot_frequency_spectrum(audio_data, sample_rate, title='Frequency Spectrum'):
+def plot_frequency_spectrum(audio_data, sample_rate, title='Frequency Spectrum',
+                            spectra=None):
     """
     Plot the frequency spectrum of an audio signal.
 
+    The spectrum is a Welch power spectral density in dB, averaged from
+    the same STFT frames as the spectrogram so it needs no FFT of its own.
+
     Args:
         audio_data (np.ndarray): Audio signal data.
         sample_rate (int): Sampling rate of the audio.
         title (str): Title of the plot.
+        spectra (AudioSpectra, optional): Precomputed analysis of
+            ``audio_data``.
     """
-    fig, ax = plt.subplots(figsize=(10, 4))
+    if spectra is None:
+        spectra = compute_spectra(audio_data, sample_rate)
 
-    # Calculate FFT
-    n_fft = min(8192, len(audio_data))
-    fft = np.fft.fft(audio_data, n_fft)
-    freqs = np.fft.fftfreq(n_fft, 1/sample_rate)
+    fig, ax = _get_figure((10, 4))
 
-    # Positive frequencies
-    positive_freq_idx = freqs >= 0
-    freqs_positive = freqs[positive_freq_idx]
-    magnitude = np.abs(fft[positive_freq_idx])
-
-    ax.plot(freqs_positive, magnitude, linewidth=1)
+    ax.plot(spectra.freqs, 10 * np.log10(spectra.psd + 1e-20), linewidth=1)
     ax.set_xlabel('Frequency (Hz)')
-    ax.set_ylabel('Magnitude')
+    ax.set_ylabel('Power (dB/Hz)')
     ax.set_title(title)
     ax.grid(True, alpha=0.3)
     ax.set_xlim(0, sample_rate/2)
 
-    st.pyplot(fig)
-    plt.close()
+    _show_figure(fig)
 
 
 def plot_comparison(original_data, processed_data, sample_rate, effect_name):
@@ -119,47 +572,60 @@ def plot_comparison(original_data, processed_data, sample_rate, effect_name):
 
 
 def plot_spectrogram_comparison(original_data, processed_data, sample_rate,
-                               effect_name):
+                               effect_name, original_spectra=None,
+                               processed_spectra=None):
     """
     Plot original and processed audio spectrograms side by side with effect name.
+
+    ``original_spectra`` and ``processed_spectra`` are optional precomputed
+    ``AudioSpectra`` for the two signals.
     """
     col1, col2 = st.columns(2)
 
     with col1:
         plot_spectrogram(
             original_data, sample_rate,
-            f'Original Spectrogram – {effect_name}'
+            f'Original Spectrogram – {effect_name}',
+            spectra=original_spectra,
         )
 
     with col2:
         plot_spectrogram(
             processed_data, sample_rate,
-            f'Processed Spectrogram – {effect_name}'
+            f'Processed Spectrogram – {effect_name}',
+            spectra=processed_spectra,
         )
 
 
 def plot_frequency_spectrum_comparison(original_data, processed_data,
-                                      sample_rate, effect_name):
+                                      sample_rate, effect_name,
+                                      original_spectra=None,
+                                      processed_spectra=None):
     """
     Plot original and processed audio frequency spectra side by side with effect name.
+
+    ``original_spectra`` and ``processed_spectra`` are optional precomputed
+    ``AudioSpectra`` for the two signals.
     """
     col1, col2 = st.columns(2)
 
     with col1:
         plot_frequency_spectrum(
             original_data, sample_rate,
-            f'Original Spectrum – {effect_name}'
+            f'Original Spectrum – {effect_name}',
+            spectra=original_spectra,
         )
 
     with col2:
         plot_frequency_spectrum(
             processed_data, sample_rate,
-            f'Processed Spectrum – {effect_name}'
+            f'Processed Spectrum – {effect_name}',
+            spectra=processed_spectra,
         )
 
 
 def plot_comprehensive_comparison(original_data, processed_data, sample_rate,
-                                 transformation_name):
+                                 transformation_name, original_spectra=None):
     """
     Plot comprehensive comparison including waveforms, spectrograms
     and frequency spectra.
@@ -169,9 +635,20 @@ def plot_comprehensive_comparison(original_data, processed_data, sample_rate,
         processed_data (np.ndarray): Processed audio data.
         sample_rate (int): Sampling rate of the audio.
         transformation_name (str): Name of the transformation applied.
+        original_spectra (AudioSpectra, optional): Precomputed analysis of
+            the original audio; only the processed audio is transformed
+            when it is given.
     """
     st.header(f"Analysis: {transformation_name}")
 
+    if original_spectra is None:
+        # Both signals go through one batched FFT
+        original_spectra, processed_spectra = compute_spectra_batch(
+            [original_data, processed_data], sample_rate
+        )
+    else:
+        processed_spectra = compute_spectra(processed_data, sample_rate)
+
     # Waveform comparison
     st.subheader("Waveform Comparison")
     plot_comparison(original_data, processed_data, sample_rate,
@@ -180,9 +657,11 @@ def plot_comprehensive_comparison(original_data, processed_data, sample_rate,
     # Frequency spectrum comparison
     st.subheader("Frequency Spectrum Comparison")
     plot_frequency_spectrum_comparison(original_data, processed_data,
-                                      sample_rate, transformation_name)
+                                      sample_rate, transformation_name,
+                                      original_spectra, processed_spectra)
 
     # Spectrogram comparison
     st.subheader("Spectrogram Comparison")
     plot_spectrogram_comparison(original_data, processed_data, sample_rate,
-                               transformation_name)
+                               transformation_name, original_spectra,
+                               processed_spectra)